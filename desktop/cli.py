@@ -3,84 +3,299 @@
 VideoDownloader CLI — headless command-line interface for yt-dlp downloads.
 
 Usage:
-    python desktop/cli.py download URL [--quality best|worst|720p|480p|360p] [--output DIR] [--audio-only] [--format mp4|webm|mkv]
-    python desktop/cli.py info URL
+    python desktop/cli.py download URL [URL ...] [--batch-file FILE] [--quality best|worst|720p|480p|360p] [--output DIR] [--audio-only] [--format mp4|webm|mkv]
+    python desktop/cli.py info URL [URL ...] [--no-cache] [--flat|--no-flat]
+    python desktop/cli.py shell
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
 import json
+import re
+import shlex
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional
 
-import yt_dlp
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj, indent: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+except ImportError:  # optional speedup; stdlib json handles bytes too
+    json_loads = json.loads
+
+    def json_dumps(obj, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+SETTINGS_FILE = Path.home() / ".videodownloader_settings.json"
+DEFAULT_SETTINGS = {
+    "output_dir": str(Path.home() / "Downloads" / "VideoDownloader"),
+    "quality": "best",
+    "format_preference": "mp4",
+    "audio_only": False,
+}
+
+CACHE_DIR = Path.home() / ".videodownloader_cache"
+INFO_CACHE_TTL = 24 * 60 * 60  # seconds
+YTDLP_CACHE_DIR = CACHE_DIR / "yt-dlp"  # player JS / signature cache, kept across runs
+SOCKET_TIMEOUT = 10  # seconds; fail fast on stalled connections instead of yt-dlp's 20s
+
+# Options shared by every YoutubeDL the CLI creates
+BASE_YDL_OPTS = {
+    "quiet": True,
+    "no_warnings": True,
+    "cachedir": str(YTDLP_CACHE_DIR),
+    "socket_timeout": SOCKET_TIMEOUT,
+}
+
+INFO_CONCURRENCY = 10  # parallel extractions for `info`; keeps clear of rate limits
+
+# `info` only needs metadata, so query one lightweight YouTube client and
+# skip the HLS/DASH manifests and the translated caption list, which is
+# usually the bulk of the info dict
+INFO_EXTRACTOR_ARGS = {
+    "youtube": {"player_client": ["android_vr"], "skip": ["hls", "dash", "translated_subs"]},
+}
+
+DEFAULT_PLAYER_CLIENT = "default"  # yt-dlp's own client set; what `download` queries unless told otherwise
+
+# URLs that resolve to a list of videos; `info` lists their entries flat by default
+# (a bare /@handle is a channel, but /@user/video/... on TikTok and the like is one video)
+PLAYLIST_URL_RE = re.compile(
+    r"[?&]list=|/playlist\b|/channel/|/c/|/user/|/@[^/?#]+(?:/(?:videos|shorts|streams))?/?(?:[?#]|$)"
+)
+
+PROGRESS_INTERVAL = 0.1  # minimum seconds between progress line updates
+
+# Serializes console output when several downloads run in parallel
+_print_lock = threading.Lock()
+
+
+def _log(*args, **kwargs) -> None:
+    with _print_lock:
+        print(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_settings_file(settings_file: Path, mtime: float) -> dict:
+    """Parse the settings file; cached per mtime so repeat loads are free."""
+    return json_loads(settings_file.read_bytes())
 
 
 def load_settings() -> dict:
     """Load settings from the GUI app's settings file if it exists."""
-    settings_file = Path.home() / ".videodownloader_settings.json"
-    defaults = {
-        "output_dir": str(Path.home() / "Downloads" / "VideoDownloader"),
-        "quality": "best",
-        "format_preference": "mp4",
-        "audio_only": False,
-    }
+    settings = dict(DEFAULT_SETTINGS)
     try:
-        if settings_file.exists():
-            with open(settings_file, "r") as f:
-                defaults.update(json.load(f))
+        mtime = SETTINGS_FILE.stat().st_mtime
+        settings.update(_read_settings_file(SETTINGS_FILE, mtime))
     except Exception:
         pass
-    return defaults
+    return settings
+
+
+def _info_cache_path(url: str) -> Path:
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+    return CACHE_DIR / f"info_{digest}.json"
+
+
+def load_cached_info(url: str) -> Optional[dict]:
+    """Return cached `info` output for a URL if it is younger than the TTL."""
+    cache_file = _info_cache_path(url)
+    try:
+        if time.time() - cache_file.stat().st_mtime < INFO_CACHE_TTL:
+            return json_loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def save_cached_info(url: str, data: dict) -> None:
+    """Persist `info` output for a URL; cache failures are never fatal."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _info_cache_path(url).write_text(json_dumps(data), encoding="utf-8")
+    except OSError:
+        pass
+
+
+# yt-dlp format strings keyed by (audio_only, quality, format); "*" matches
+# any value. Specific heights are filled into _HEIGHT_TEMPLATES instead.
+_FORMAT_TABLE = {
+    (True, "*", "mp4"): "ba[ext=m4a]/ba",
+    (True, "*", "webm"): "ba[ext=webm]/ba",
+    (True, "*", "*"): "ba/b",
+    (False, "best", "mp4"): "bv*[ext=mp4][height<=1080]+ba[ext=m4a]/bv*[height<=1080]+ba/b[height<=1080]",
+    (False, "best", "webm"): "bv*[ext=webm]+ba[ext=webm]/bv*+ba",
+    (False, "best", "mkv"): "bv*+ba/b",
+    (False, "best", "*"): "bv*[ext=mp4]+ba[ext=m4a]/bv*+ba/b",
+    (False, "worst", "*"): "wv*+wa/w",
+}
+
+_HEIGHT_TEMPLATES = {
+    "mp4": "bv*[height<={h}][ext=mp4]+ba[ext=m4a]/bv*[height<={h}]+ba",
+    "webm": "bv*[height<={h}][ext=webm]+ba[ext=webm]/bv*[height<={h}]+ba",
+    "*": "bv*[height<={h}]+ba",
+}
 
 
 def build_format_string(quality: str, fmt: str, audio_only: bool) -> str:
-    """Build yt-dlp format string from quality/format/audio preferences."""
-    if audio_only:
-        if fmt == "mp4":
-            return "ba[ext=m4a]/ba"
-        if fmt == "webm":
-            return "ba[ext=webm]/ba"
-        return "ba/b"
-
-    if quality == "best":
-        if fmt == "mp4":
-            return "bv*[ext=mp4][height<=1080]+ba[ext=m4a]/bv*[height<=1080]+ba/b[height<=1080]"
-        if fmt == "webm":
-            return "bv*[ext=webm]+ba[ext=webm]/bv*+ba"
-        if fmt == "mkv":
-            return "bv*+ba/b"
-        return "bv*[ext=mp4]+ba[ext=m4a]/bv*+ba/b"
-    if quality == "worst":
-        return "wv*+wa/w"
-
-    height = quality.replace("p", "")
-    if fmt == "mp4":
-        return f"bv*[height<={height}][ext=mp4]+ba[ext=m4a]/bv*[height<={height}]+ba"
-    if fmt == "webm":
-        return f"bv*[height<={height}][ext=webm]+ba[ext=webm]/bv*[height<={height}]+ba"
-    return f"bv*[height<={height}]+ba"
-
-
-def cmd_info(args):
-    """Print video metadata as JSON."""
-    opts = {"quiet": True, "no_warnings": True}
-    with yt_dlp.YoutubeDL(opts) as ydl:
-        info = ydl.extract_info(args.url, download=False)
-
-    out = {
-        "title": info.get("title"),
-        "uploader": info.get("uploader"),
-        "duration": info.get("duration"),
-        "view_count": info.get("view_count"),
-        "url": info.get("webpage_url", args.url),
-        "thumbnail": info.get("thumbnail"),
-        "description": info.get("description", "")[:500],
-    }
-    print(json.dumps(out, indent=2, ensure_ascii=False))
+    """Build yt-dlp format string from quality/format/audio preferences.
+
+    >>> build_format_string("best", "mkv", False)
+    'bv*+ba/b'
+    >>> build_format_string("720p", "mp4", False)
+    'bv*[height<=720][ext=mp4]+ba[ext=m4a]/bv*[height<=720]+ba'
+    >>> build_format_string("480p", "any", True)
+    'ba/b'
+    """
+    quality_key = "*" if audio_only else quality
+    fmt_string = _FORMAT_TABLE.get((audio_only, quality_key, fmt)) or _FORMAT_TABLE.get((audio_only, quality_key, "*"))
+    if fmt_string:
+        return fmt_string
+    template = _HEIGHT_TEMPLATES.get(fmt, _HEIGHT_TEMPLATES["*"])
+    return template.format(h=quality.replace("p", ""))
+
+
+def is_playlist_url(url: str) -> bool:
+    """Return True for playlist/channel-shaped URLs."""
+    return PLAYLIST_URL_RE.search(url) is not None
+
 
+def _fetch_info(url: str, use_cache: bool = True, flat: bool = False, session: Optional[dict] = None) -> dict:
+    """Return the `info` summary for one URL, from cache when possible.
+
+    With flat=True playlist entries are listed without resolving each video,
+    so only id/title/url are reported for them.
+
+    With a `session` dict (the shell's), a full extraction is done the way
+    `download` would do it and the complete info dict is kept there by URL,
+    so a following `download` of the same URL doesn't extract it again.
+    """
+    keep = session is not None and not flat
+    info = session.get(url) if keep else None
+    if info is None:
+        cache_key = f"flat:{url}" if flat else url
+        out = load_cached_info(cache_key) if use_cache else None
+        if out is not None:
+            return out
+
+        import yt_dlp  # deferred: importing the extractors is slow
+
+        if keep:
+            opts = {**BASE_YDL_OPTS, "extractor_args": {"youtube": {"player_client": [DEFAULT_PLAYER_CLIENT]}}}
+        else:
+            # Live streams and premieres may have no formats left without
+            # HLS/DASH; `info` doesn't report formats, so that isn't an error
+            opts = {**BASE_YDL_OPTS, "extractor_args": INFO_EXTRACTOR_ARGS, "ignore_no_formats_error": True}
+        if flat:
+            opts["extract_flat"] = "in_playlist"
+        with yt_dlp.YoutubeDL(opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+        if keep:
+            session[url] = info
+
+    if flat and info.get("_type") == "playlist":
+        out = {
+            "title": info.get("title"),
+            "uploader": info.get("uploader"),
+            "url": info.get("webpage_url", url),
+            "entries": [
+                {"id": entry.get("id"), "title": entry.get("title"), "url": entry.get("url")}
+                for entry in info.get("entries") or []
+                if entry
+            ],
+        }
+    else:
+        out = {
+            "title": info.get("title"),
+            "uploader": info.get("uploader"),
+            "duration": info.get("duration"),
+            "view_count": info.get("view_count"),
+            "url": info.get("webpage_url", url),
+            "thumbnail": info.get("thumbnail"),
+            "description": (info.get("description") or "")[:500],
+        }
+    save_cached_info(f"flat:{url}" if flat else url, out)
+    return out
+
+
+async def cmd_info(args, session: Optional[dict] = None):
+    """Print video metadata as JSON (a list when several URLs are given)."""
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(INFO_CONCURRENCY)
+
+    async def fetch(url):
+        async with semaphore:
+            flat = is_playlist_url(url) if args.flat is None else args.flat
+            return await loop.run_in_executor(None, _fetch_info, url, not args.no_cache, flat, session)
+
+    results = await asyncio.gather(*(fetch(url) for url in args.url), return_exceptions=True)
+
+    if len(args.url) == 1:
+        if isinstance(results[0], BaseException):
+            raise results[0]
+        out = results[0]
+    else:
+        out = [
+            {"url": url, "error": str(result)} if isinstance(result, BaseException) else result
+            for url, result in zip(args.url, results)
+        ]
+    print(json_dumps(out, indent=True))
+
+
+def read_batch_file(path: str) -> List[str]:
+    """Read URLs from a batch file ("-" for stdin), skipping blanks and comments."""
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, "r") as f:
+            lines = f.read().splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith(("#", ";", "]"))]
+
+
+def _download_url(ydl, url: str, reraise: bool = False, info: Optional[dict] = None) -> bool:
+    """Extract and download a single URL; returns False if it failed.
+
+    An `info` dict already extracted for the URL is used instead of extracting it again.
+    """
+    _log(f"Downloading: {url}")
+    try:
+        if info is None:
+            info = ydl.extract_info(url, download=False)
+        _log(f"  Title: {info.get('title', 'Unknown')}")
+        # Reuse the extracted info instead of letting download() re-extract it
+        ydl.process_ie_result(info, download=True)
+        return True
+    except Exception as e:
+        if reraise:
+            raise
+        _log(f"  Error: {url}: {e}", file=sys.stderr)
+        return False
+
+
+def cmd_download(args, session: Optional[dict] = None):
+    """Download one or more video/audio files.
+
+    Info the shell's `session` holds for a URL is reused (and dropped, as
+    its stream URLs expire) when the default player clients are queried.
+    """
+    urls = list(args.url)
+    if args.batch_file:
+        urls.extend(read_batch_file(args.batch_file))
+    if not urls:
+        raise ValueError("no URLs given (pass URLs or --batch-file)")
+
+    import yt_dlp  # deferred: importing the extractors is slow
 
-def cmd_download(args):
-    """Download a video/audio file."""
     settings = load_settings()
     output_dir = Path(args.output or settings["output_dir"])
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -89,38 +304,120 @@ def cmd_download(args):
     fmt = args.format or settings.get("format_preference", "mp4")
     audio_only = args.audio_only or settings.get("audio_only", False)
 
+    last_progress = [0.0]
+
     def progress_hook(d):
         if d["status"] == "downloading":
+            # yt-dlp reports many ticks per second; redraw at most ~10x/s
+            now = time.monotonic()
+            if now - last_progress[0] < PROGRESS_INTERVAL:
+                return
+            last_progress[0] = now
             pct = d.get("_percent_str", "?%").strip()
             speed = d.get("_speed_str", "")
             eta = d.get("_eta_str", "")
-            print(f"\r  {pct}  {speed}  ETA: {eta}  ", end="", flush=True)
+            _log(f"\r  {pct}  {speed}  ETA: {eta}  ", end="", flush=True)
         elif d["status"] == "finished":
-            print(f"\n  Finished: {Path(d.get('filename', '')).name}")
+            _log(f"\n  Finished: {Path(d.get('filename', '')).name}")
 
     ydl_opts = {
+        **BASE_YDL_OPTS,
         "outtmpl": str(output_dir / "%(title)s.%(ext)s"),
         "format": build_format_string(quality, fmt, audio_only),
         "progress_hooks": [progress_hook],
-        "quiet": True,
-        "no_warnings": True,
+        "concurrent_fragment_downloads": args.concurrent_fragments,
+        "extractor_args": {"youtube": {"player_client": args.player_client.split(",")}},
     }
 
     if not audio_only and fmt in ("mp4", "webm", "mkv"):
         ydl_opts["merge_output_format"] = fmt
 
-    print(f"Downloading: {args.url}")
     print(f"  Quality: {quality} | Format: {fmt} | Audio-only: {audio_only}")
     print(f"  Output: {output_dir}")
 
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(args.url, download=False)
-        print(f"  Title: {info.get('title', 'Unknown')}")
-        ydl.download([args.url])
+    if session is None or args.player_client != DEFAULT_PLAYER_CLIENT:
+        session = {}
+    prefetched = {url: session.pop(url) for url in urls if url in session}
+
+    failed = []
+    if args.jobs <= 1 or len(urls) == 1:
+        # One YoutubeDL for the whole batch so its connection pool and
+        # player JS cache are shared across URLs
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            for url in urls:
+                if not _download_url(ydl, url, reraise=len(urls) == 1, info=prefetched.get(url)):
+                    failed.append(url)
+    else:
+        # YoutubeDL isn't thread-safe, so each worker thread gets its own
+        # instance and reuses it for every URL it picks up
+        local = threading.local()
+        instances = []
 
+        def download_in_worker(url):
+            ydl = getattr(local, "ydl", None)
+            if ydl is None:
+                ydl = local.ydl = yt_dlp.YoutubeDL(dict(ydl_opts))
+                with _print_lock:
+                    instances.append(ydl)
+            return _download_url(ydl, url, info=prefetched.get(url))
+
+        try:
+            with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+                for url, ok in zip(urls, executor.map(download_in_worker, urls)):
+                    if not ok:
+                        failed.append(url)
+        finally:
+            for ydl in instances:
+                ydl.close()
+
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(urls)} downloads failed")
     print("Done.")
 
 
+def cmd_shell(parser):
+    """Run `info`/`download` commands read from stdin in one process.
+
+    yt-dlp is imported once, and the full info `info` extracts is kept for
+    the session so a `download` of the same URL skips the extraction.
+    """
+    session = {}
+    interactive = sys.stdin.isatty()
+    if interactive:
+        print("VideoDownloader shell — enter 'info ...' or 'download ...', 'quit' to exit")
+    while True:
+        try:
+            line = input("> " if interactive else "")
+        except EOFError:
+            break
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            continue
+        if not argv:
+            continue
+        if argv[0] in ("quit", "exit"):
+            break
+        try:
+            args = parser.parse_args(argv)
+        except SystemExit:
+            continue  # argparse has already printed the problem
+        if args.command == "shell":
+            continue
+        try:
+            run_command(args, session)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+
+
+def run_command(args, session: Optional[dict] = None):
+    if args.command == "info":
+        asyncio.run(cmd_info(args, session))
+    elif args.command == "download":
+        cmd_download(args, session)
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="VideoDownloader CLI",
@@ -130,23 +427,43 @@ def main():
 
     # info
     info_parser = sub.add_parser("info", help="Get video metadata")
-    info_parser.add_argument("url", help="Video URL")
+    info_parser.add_argument("url", nargs="+", help="Video URL(s)")
+    info_parser.add_argument("--no-cache", action="store_true", help="Ignore cached metadata and fetch fresh")
+    info_parser.add_argument(
+        "--flat", dest="flat", action="store_true", default=None,
+        help="List playlist entries without resolving each video (default for playlist/channel URLs)",
+    )
+    info_parser.add_argument("--no-flat", dest="flat", action="store_false", help="Resolve every playlist entry")
 
     # download
     dl_parser = sub.add_parser("download", help="Download a video")
-    dl_parser.add_argument("url", help="Video URL")
+    dl_parser.add_argument("url", nargs="*", help="Video URL(s)")
+    dl_parser.add_argument("--batch-file", "-a", help="File with one URL per line (- for stdin)")
+    dl_parser.add_argument("--jobs", "-j", type=int, default=1, help="Number of URLs to download in parallel")
+    dl_parser.add_argument(
+        "--concurrent-fragments", "-N", type=int, default=4,
+        help="Fragments of a DASH/HLS stream to download in parallel",
+    )
+    dl_parser.add_argument(
+        "--player-client", default=DEFAULT_PLAYER_CLIENT,
+        help="Comma-separated YouTube player clients for yt-dlp to query (default: yt-dlp's own set)",
+    )
     dl_parser.add_argument("--quality", choices=["best", "worst", "720p", "480p", "360p"])
     dl_parser.add_argument("--output", "-o", help="Output directory")
     dl_parser.add_argument("--audio-only", action="store_true", help="Extract audio only")
     dl_parser.add_argument("--format", choices=["mp4", "webm", "mkv", "any"])
 
+    # shell
+    sub.add_parser("shell", help="Read info/download commands from stdin in one process")
+
     args = parser.parse_args()
 
+    if args.command == "shell":
+        cmd_shell(parser)
+        return
+
     try:
-        if args.command == "info":
-            cmd_info(args)
-        elif args.command == "download":
-            cmd_download(args)
+        run_command(args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -3,26 +3,24 @@
 Simple launcher for VideoDownloader Desktop
 """
 
-import subprocess
 import sys
-import os
 from pathlib import Path
 
 def main():
     # Get the script directory
     script_dir = Path(__file__).parent
     main_script = script_dir / "main.py"
-    
+
     if not main_script.exists():
         print("❌ main.py not found!")
         sys.exit(1)
-    
-    # Run the main application
+
+    # Run the main application in this interpreter rather than a child process
+    sys.path.insert(0, str(script_dir))
+    from main import main as run_app
+
     try:
-        subprocess.run([sys.executable, str(main_script)], check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to start VideoDownloader: {e}")
-        sys.exit(1)
+        run_app()
     except KeyboardInterrupt:
         print("\n👋 VideoDownloader closed")
 
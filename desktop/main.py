@@ -4,28 +4,119 @@ VideoDownloader Desktop - Smart Launcher
 Automatically handles tkinter issues on macOS
 """
 
-import sys
 import os
+import sys
+import json
+import platform
+import subprocess
+from pathlib import Path
 
-def main():
-    # Try to import tkinter first
+SYSTEM_PYTHON = '/usr/bin/python3'
+TK_PROBE_CACHE = Path.home() / ".videodownloader_cache" / "tkinter_ok.json"
+
+def check_tkinter():
+    """Check if tkinter is available"""
     try:
         import tkinter
-        # If successful, run the main app
+        return True
+    except ImportError:
+        return False
+
+# Probed once per launch and shared by everything below
+_TK_OK = check_tkinter()
+
+def _probe_system_tk():
+    """Check if system Python has tkinter, cached per interpreter build and OS version"""
+    try:
+        st = os.stat(SYSTEM_PYTHON)
+    except OSError:
+        return False
+    key = f"{SYSTEM_PYTHON}:{st.st_mtime}:{st.st_size}:{platform.mac_ver()[0]}"
+
+    try:
+        cached = json.loads(TK_PROBE_CACHE.read_text())
+        if cached.get("key") == key:
+            return bool(cached["ok"])
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    try:
+        result = subprocess.run([SYSTEM_PYTHON, '-c', 'import tkinter'],
+                              capture_output=True)
+    except OSError:
+        return False
+    ok = result.returncode == 0
+
+    try:
+        TK_PROBE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        TK_PROBE_CACHE.write_text(json.dumps({"key": key, "ok": ok}))
+    except OSError:
+        pass
+    return ok
+
+def install_tkinter_macos():
+    """Install tkinter on macOS"""
+    print("🔧 Installing tkinter support for macOS...")
+
+    try:
+        # Try installing python-tk via Homebrew
+        result = subprocess.run(['brew', 'install', 'python-tk'],
+                              capture_output=True, text=True)
+        if result.returncode == 0:
+            print("✅ tkinter installed via Homebrew")
+            return True
+    except FileNotFoundError:
+        pass
+
+    # Alternative: Install using system Python with tkinter
+    print("⚠️  Homebrew not available or failed. Trying alternative...")
+
+    # Check if system Python has tkinter
+    if _probe_system_tk():
+        print("✅ System Python has tkinter. Using system Python...")
+        return "system"
+
+    return False
+
+def fix_tkinter():
+    """Try to get a working tkinter, re-launching under system Python if needed"""
+    print("❌ tkinter not found. This is common on macOS with Homebrew Python.")
+    print("🔧 Attempting to fix...")
+
+    result = install_tkinter_macos()
+
+    if result == "system":
+        # Use system Python instead
+        script_path = Path(__file__).resolve()
+        print(f"🚀 Launching with system Python...")
+        # execv replaces this process without flushing Python's buffers
+        sys.stdout.flush()
+        os.execv(SYSTEM_PYTHON, [SYSTEM_PYTHON, str(script_path)])
+    elif result == True:
+        print("✅ tkinter installed. Please restart the application.")
+    else:
+        print("❌ Failed to install tkinter automatically.")
+        print("\n🛠️  Manual Fix Options:")
+        print("1. Install via Homebrew:")
+        print("   brew install python-tk")
+        print("\n2. Use system Python (has tkinter built-in):")
+        print("   /usr/bin/python3 desktop/main.py")
+        print("\n3. Install Python from python.org (includes tkinter)")
+
+def main():
+    if not _TK_OK:
+        fix_tkinter()
+        return
+
+    try:
         from main_app import VideoDownloaderGUI
-        app = VideoDownloaderGUI()
-        app.run()
-        
     except ImportError as e:
-        if "tkinter" in str(e) or "_tkinter" in str(e):
-            print("🔧 Tkinter issue detected. Trying macOS-specific launcher...")
-            # Run the macOS-specific launcher
-            from launcher_macos import main as macos_main
-            macos_main()
-        else:
-            print(f"❌ Import error: {e}")
-            print("Please install dependencies: pip install -r ../desktop_requirements.txt")
-            sys.exit(1)
+        print(f"❌ Import error: {e}")
+        print("Please install dependencies: pip install -r ../desktop_requirements.txt")
+        sys.exit(1)
+
+    app = VideoDownloaderGUI()
+    app.run()
 
 if __name__ == "__main__":
     main()
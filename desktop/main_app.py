@@ -8,30 +8,292 @@ Built with CustomTkinter for a sleek, modern interface
 import os
 import sys
 import json
+import asyncio
+import copy
+import functools
+import itertools
+import sqlite3
 import threading
 import time
-from datetime import datetime
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple
 from queue import Queue, Empty
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 import re
 
 import customtkinter as ctk
 import yt_dlp
-from PIL import Image, ImageTk
+from PIL import Image
 import requests
+from requests.adapters import HTTPAdapter
 from io import BytesIO
 
+try:
+    import orjson
+    
+    json_loads = orjson.loads
+    
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0))
+except ImportError:  # optional speedup; stdlib json is the fallback
+    json_loads = json.loads
+    
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
 # Configure CustomTkinter appearance
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+@functools.lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """Shared keep-alive connection pool for thumbnail fetches, created on first use"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=1))
+    session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=1))
+    return session
+
+@functools.lru_cache(maxsize=1)
+def _thumb_pool() -> ThreadPoolExecutor:
+    """Worker pool for thumbnail fetches, created on first use"""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="thumb")
+
+@functools.lru_cache(maxsize=64)
+def _fetch_thumbnail(url: str) -> Image.Image:
+    """Download and downscale a thumbnail (runs on the thumbnail pool, cached per URL)"""
+    response = _http_session().get(url, timeout=5)
+    response.raise_for_status()
+    img = Image.open(BytesIO(response.content))
+    # Let libjpeg decode at a reduced scale (no-op for other formats); 2x the
+    # target keeps enough detail for the final resize
+    img.draft('RGB', (320, 180))
+    # BILINEAR is indistinguishable from LANCZOS at 160x90 and much cheaper
+    return img.resize((160, 90), Image.Resampling.BILINEAR)
+
+# Metadata fetches (preview analysis, untitled playlist entries, download
+# jobs) share one pool, one YoutubeDL per pool thread (instances aren't
+# thread-safe)
+_META_WORKERS = 8
+_ENTRY_CONCURRENCY = 8
+_PREVIEW_PLAYLIST_END = 50  # Entries analysed for a playlist/channel preview
+# Room for a whole previewed playlist's entries plus a few single videos, so
+# resolved entries are still cached when they are downloaded
+_INFO_CACHE_SIZE = _PREVIEW_PLAYLIST_END + 16
+_meta_ydl = threading.local()
+
+# Options for YoutubeDLs whose info is later handed to a download job. They
+# don't ask for subtitles (many extractors then skip fetching them), so jobs
+# that save subtitles extract with their own instance instead
+_EXTRACT_OPTS = MappingProxyType({
+    'quiet': True,
+    'no_warnings': True,
+})
+
+def _extract_info(url: str) -> Dict:
+    """Full yt-dlp info for a URL (runs on the metadata pool)"""
+    ydl = getattr(_meta_ydl, 'ydl', None)
+    if ydl is None:
+        ydl = _meta_ydl.ydl = yt_dlp.YoutubeDL(dict(_EXTRACT_OPTS))
+    return ydl.extract_info(url, download=False)
+
+@functools.lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Shared CTkFont per size/weight, created on first use (needs a Tk root)"""
+    return ctk.CTkFont(size=size, weight=weight)
+
+def _progress_hook(events: Queue, closing: threading.Event, job: list, d: Dict):
+    """yt-dlp progress hook, bound per pooled YoutubeDL with functools.partial.
+    
+    Called many times per second from a download thread, so it only queues
+    the event (tagged with the current download id, job[0]) for the Tk tick.
+    """
+    if closing.is_set():  # Abort in-flight downloads when the app exits
+        raise yt_dlp.utils.DownloadCancelled()
+    events.put_nowait((job[0], dict(d)))
+
+@functools.lru_cache(maxsize=1)
+def _settings_path() -> Path:
+    """Settings file location (resolved once; clear the cache to re-read $HOME)"""
+    return Path.home() / ".videodownloader_settings.json"
+
+# Settings writes are coalesced: a burst of saves within this window is
+# written to disk once by the writer thread
+_SETTINGS_WRITE_DELAY = 0.3
+
+_DEFAULT_SETTINGS = MappingProxyType({
+    "output_dir": str(Path.home() / "Downloads" / "VideoDownloader"),
+    "quality": "best",
+    "format_preference": "mp4",
+    "audio_only": False,
+    "include_subtitles": False,
+    "concurrent_downloads": 3,
+    "organize_in_folders": False,
+    "save_metadata": False
+})
+
+# Choices offered in Settings; also the axes of FORMAT_MATRIX
+QUALITY_CHOICES = ("best", "worst", "720p", "480p", "360p")
+FORMAT_CHOICES = ("mp4", "webm", "mkv", "any")
+
+def build_format(kind: str, format_pref: str, quality: str) -> Tuple[str, Optional[str]]:
+    """yt-dlp (format, merge_output_format) for an audio or video download"""
+    if kind == "audio":
+        # Audio-only downloads
+        if format_pref == "mp4":
+            return 'ba[ext=m4a]/ba', None
+        if format_pref == "webm":
+            return 'ba[ext=webm]/ba', None
+        return 'ba/b', None
+    
+    # Video downloads with audio
+    if quality == "best":
+        if format_pref == "mp4":
+            # Best quality MP4 with fallback
+            return 'bv*[ext=mp4][height<=1080]+ba[ext=m4a]/bv*[height<=1080]+ba/b[height<=1080]', 'mp4'
+        if format_pref == "webm":
+            # Best quality WebM
+            return 'bv*[ext=webm]+ba[ext=webm]/bv*+ba', 'webm'
+        if format_pref == "mkv":
+            # High quality MKV (for those who need it)
+            return 'bv*+ba/b', 'mkv'
+        # "any": best available format, prefer MP4
+        return 'bv*[ext=mp4]+ba[ext=m4a]/bv*+ba/b', 'mp4'
+    if quality == "worst":
+        return 'wv*+wa/w', None
+    
+    # Specific quality with format preference
+    quality_num = quality.replace('p', '')
+    if format_pref == "mp4":
+        return f'bv*[height<={quality_num}][ext=mp4]+ba[ext=m4a]/bv*[height<={quality_num}]+ba', 'mp4'
+    if format_pref == "webm":
+        return f'bv*[height<={quality_num}][ext=webm]+ba[ext=webm]/bv*[height<={quality_num}]+ba', 'webm'
+    if format_pref == "mkv":
+        return f'bv*[height<={quality_num}]+ba', 'mkv'
+    return f'bv*[height<={quality_num}]+ba', None
+
+# Every combination the Settings menus can produce, built once; anything else
+# (e.g. a hand-edited settings file) falls back to build_format
+FORMAT_MATRIX = MappingProxyType({
+    (kind, format_pref, quality): build_format(kind, format_pref, quality)
+    for kind in ("audio", "video")
+    for format_pref in FORMAT_CHOICES
+    for quality in QUALITY_CHOICES
+})
+
+# is_valid_url runs on every keystroke in the URL entry. urlsplit does the
+# structural work in linear time; the host check stays linear too, as labels
+# can't contain the dot that ends them. Hosts need a letter TLD (or are
+# localhost / an IPv4 address) so half-typed ones aren't sent for analysis
+_URL_SCHEMES = frozenset({"http", "https"})
+_HOST_RE = re.compile(r'(?:[A-Za-z0-9\-]+\.)+[A-Za-z]{2,63}\.?|localhost|\d{1,3}(?:\.\d{1,3}){3}')
+_SPACE_RE = re.compile(r'\s')
+
+# paste_url treats clipboard text as a URL if this occurs anywhere in its
+# first _CLIPBOARD_SCAN_LIMIT characters; one regex search over that bounded
+# prefix instead of a full scan per hint
+_CLIPBOARD_URL_RE = re.compile(r'://|youtube\.com|youtu\.be')
+_CLIPBOARD_SCAN_LIMIT = 2048
+
+# Query parameters that only track where a link was shared from
+_TRACKING_PARAMS = frozenset({"si", "feature", "pp", "fbclid", "gclid", "igshid", "igsh", "ref"})
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL for cache lookups (lowercase host, no tracking params or fragment)"""
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if k not in _TRACKING_PARAMS and not k.startswith("utm_")]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+class MetadataCache:
+    """SQLite cache of analyzed URL metadata so re-analyzing a URL skips yt-dlp"""
+    
+    # Fields read by the preview UI; everything else is dropped before storing
+    INFO_FIELDS = ('_type', 'id', 'title', 'duration', 'uploader', 'view_count',
+                   'thumbnail', 'webpage_url', 'url')
+    ENTRY_FIELDS = ('url', 'title', 'duration', 'uploader')
+    FORMAT_FIELDS = ('format_id', 'vcodec', 'acodec', 'height', 'abr', 'ext', 'filesize')
+    
+    def __init__(self, path: Path, ttl: int = 24 * 60 * 60):
+        self.path = path
+        self.ttl = ttl
+        self._conn = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta(url TEXT PRIMARY KEY, ts INTEGER, json BLOB)")
+        return self._conn
+    
+    @classmethod
+    def minimal_info(cls, info: Dict) -> Dict:
+        """Reduce a yt-dlp info dict to the fields the UI uses"""
+        minimal = {k: info[k] for k in cls.INFO_FIELDS if k in info}
+        if info.get('entries') is not None:
+            minimal['entries'] = [{k: e[k] for k in cls.ENTRY_FIELDS if k in e}
+                                  for e in info['entries'] if e]
+        if info.get('formats'):
+            minimal['formats'] = [{k: f[k] for k in cls.FORMAT_FIELDS if k in f}
+                                  for f in info['formats']]
+        return minimal
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """Return cached metadata for a URL, or None if missing or expired"""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT json FROM meta WHERE url=? AND ts>?",
+                    (canonicalize_url(url), int(time.time()) - self.ttl)
+                ).fetchone()
+            return json_loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Metadata cache read failed: {e}")
+            return None
+    
+    def put(self, url: str, info: Dict):
+        """Store the UI-relevant subset of an info dict"""
+        try:
+            data = json_dumps(self.minimal_info(info))
+            with self._lock:
+                conn = self._connect()
+                conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?, ?)",
+                             (canonicalize_url(url), int(time.time()), data))
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Metadata cache write failed: {e}")
+    
+    def clear(self):
+        """Drop every cached entry"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM meta")
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Failed to clear metadata cache: {e}")
+
+_download_ids = itertools.count()
+
+# Longest a downloading item goes without a redraw while events keep coming
+_PROGRESS_REDRAW_INTERVAL = 1.0
+
+# A previewed single video's full info is reused for its downloads while its
+# stream URLs are still likely valid (YouTube's expire after a few hours)
+_PREFETCH_MAX_AGE = 30 * 60
+
+# Glyphs for the preview list's checkbox column, indexed by selected state
+_CHECK_GLYPHS = ("☐", "☑")
+
 class DownloadItem:
     """Represents a single download item"""
     def __init__(self, url: str, title: str = "Unknown", thumbnail: str = None):
-        self.id = f"download_{int(time.time())}_{id(self)}"
+        self.id = f"dl{next(_download_ids)}"
         self.url = url
         self.title = title
         self.thumbnail = thumbnail
@@ -39,12 +301,84 @@ class DownloadItem:
         self.progress = 0.0
         self.speed = ""
         self.eta = ""
-        self.file_size = ""
+        self.file_size_bytes = 0  # Formatted when the frame is drawn
         self.filename = ""
         self.filepath = ""
         self.error = ""
-        self.start_time = datetime.now()
-        self.end_time = None
+        self.start_time = time.monotonic()  # For elapsed/ETA math, not display
+        self.end_time = None  # time.monotonic() when it finished or failed
+        self.future = None  # Set once queued on the download pool
+        self.dirty = True  # Set when state changes; cleared once the UI has redrawn it
+        self._marked_progress = -1.0  # Progress when dirty was last set by a progress event
+        self._marked_time = 0.0  # time.monotonic() of that event
+        self._last_filename = None  # Full path self.filename was derived from
+    
+    def apply_progress(self, d: Dict):
+        """Update state from a yt-dlp progress hook dict (called on the Tk thread)"""
+        if d['status'] == 'downloading':
+            # Update progress from the byte counts; no string parsing
+            downloaded = d.get('downloaded_bytes')
+            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            if downloaded and total:
+                self.progress = downloaded * 100.0 / total
+            
+            self.speed = d.get('_speed_str', '')
+            self.eta = d.get('_eta_str', '')
+            
+            if d.get('total_bytes'):
+                self.file_size_bytes = d['total_bytes']
+            
+            self._set_filename(d.get('filename'))
+            
+            # Redraw on whole-percent steps, and at least every
+            # _PROGRESS_REDRAW_INTERVAL so speed/ETA stay live on slow
+            # downloads and on ones with no known size (progress never moves)
+            now = time.monotonic()
+            if (abs(self.progress - self._marked_progress) < 1.0
+                    and now - self._marked_time < _PROGRESS_REDRAW_INTERVAL):
+                return
+            self._marked_progress = self.progress
+            self._marked_time = now
+        
+        elif d['status'] == 'finished':
+            # The status itself is set by the GUI so its counters stay in sync
+            self.progress = 100.0
+            self.end_time = time.monotonic()
+            if d.get('filename'):
+                self._set_filename(d['filename'])
+                self.filepath = d['filename']
+        
+        self.dirty = True
+    
+    def _set_filename(self, path: Optional[str]):
+        # Same file on almost every event; only re-derive the name when it changes
+        if path and path != self._last_filename:
+            self._last_filename = path
+            self.filename = os.path.basename(path)
+
+class PreviewItem:
+    """One selectable entry in the content preview"""
+    __slots__ = ('url', 'title', 'duration', 'uploader', 'type', 'info')
+    
+    def __init__(self, url: str, title: str, duration=None, uploader: str = None,
+                 type: str = 'video', info: Dict = None):
+        self.url = url
+        self.title = title
+        self.duration = duration
+        self.uploader = uploader
+        self.type = type
+        self.info = info  # Full yt-dlp info when the preview extracted one
+    
+    def display_title(self) -> str:
+        """Title with duration inline"""
+        if self.duration:
+            try:
+                duration = int(float(self.duration))  # Handle both int and float
+                return f"{self.title} ({duration//60}:{duration%60:02d})"
+            except (ValueError, TypeError):
+                # Skip duration if it can't be parsed
+                pass
+        return self.title
 
 class VideoPreviewWindow:
     """Popup window for video preview and format selection"""
@@ -54,7 +388,7 @@ class VideoPreviewWindow:
         self.video_info = video_info
         self.callback = callback
         # Store format mappings for selection
-        self.format_map = {}  # Maps listbox index to format_id
+        self.format_map = []  # format_id per listbox row (None for headers)
         
         # Create window
         self.window = ctk.CTkToplevel(parent.root)
@@ -75,7 +409,7 @@ class VideoPreviewWindow:
         title_label = ctk.CTkLabel(
             main_frame, 
             text="Video Preview", 
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         title_label.pack(pady=(0, 30))
         
@@ -97,7 +431,7 @@ class VideoPreviewWindow:
         self.title_label = ctk.CTkLabel(
             details_frame, 
             text="", 
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_font(16, "bold"),
             wraplength=400
         )
         self.title_label.pack(anchor="w", pady=(0, 10))
@@ -105,7 +439,7 @@ class VideoPreviewWindow:
         self.details_label = ctk.CTkLabel(
             details_frame, 
             text="", 
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             wraplength=400
         )
         self.details_label.pack(anchor="w")
@@ -117,7 +451,7 @@ class VideoPreviewWindow:
         format_label = ctk.CTkLabel(
             format_frame, 
             text="Available Formats", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         format_label.pack(pady=(10, 5))
         
@@ -183,70 +517,72 @@ class VideoPreviewWindow:
     def load_thumbnail(self):
         thumbnail_url = self.video_info.get('thumbnail')
         if thumbnail_url:
-            try:
-                response = requests.get(thumbnail_url, timeout=5)
-                img = Image.open(BytesIO(response.content))
-                img = img.resize((160, 90), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                self.thumbnail_label.configure(image=photo, text="")
-                self.thumbnail_label.image = photo  # Keep a reference
-            except Exception as e:
-                print(f"Failed to load thumbnail: {e}")
+            # Fetch off the Tk thread so the preview opens without waiting on the network
+            future = _thumb_pool().submit(_fetch_thumbnail, thumbnail_url)
+            future.add_done_callback(self._on_thumbnail_loaded)
+    
+    def _on_thumbnail_loaded(self, future):
+        """Hand a fetched thumbnail back to the Tk thread"""
+        try:
+            img = future.result()
+        except Exception as e:
+            print(f"Failed to load thumbnail: {e}")
+            return
+        try:
+            self.window.after(0, self._apply_thumbnail, img)
+        except (tk.TclError, RuntimeError):
+            pass  # Preview was closed before the thumbnail arrived
+    
+    def _apply_thumbnail(self, img):
+        # CTkImage keeps per-DPI scaled copies (and its own reference), so HiDPI
+        # displays don't rescale the bitmap on every repaint
+        photo = ctk.CTkImage(light_image=img, dark_image=img, size=(160, 90))
+        self.thumbnail_label.configure(image=photo, text="")
     
     def load_formats(self):
         formats = self.video_info.get('formats', [])
         
-        # Group and sort formats
-        video_formats = []
-        audio_formats = []
-        
-        for fmt in formats:
-            if fmt.get('vcodec') and fmt.get('vcodec') != 'none':
-                video_formats.append(fmt)
-            elif fmt.get('acodec') and fmt.get('acodec') != 'none':
-                audio_formats.append(fmt)
-        
-        # Sort by quality
-        video_formats.sort(key=lambda x: x.get('height', 0), reverse=True)
-        audio_formats.sort(key=lambda x: x.get('abr', 0), reverse=True)
-        
-        # Clear previous format mappings
-        self.format_map.clear()
-        listbox_index = 0
-        
-        # Add to listbox with format mapping
-        self.format_listbox.insert(tk.END, "=== VIDEO FORMATS ===")
-        listbox_index += 1
-        
-        for fmt in video_formats[:10]:  # Limit to 10 best
-            height = fmt.get('height', 'Unknown')
-            ext = fmt.get('ext', 'Unknown')
-            filesize = fmt.get('filesize')
-            size_str = f" ({filesize//1024//1024}MB)" if filesize else ""
-            
-            text = f"{height}p {ext.upper()}{size_str}"
-            self.format_listbox.insert(tk.END, text)
-            # Map this listbox index to the format_id
-            self.format_map[listbox_index] = fmt.get('format_id')
-            listbox_index += 1
-        
-        if audio_formats:
-            self.format_listbox.insert(tk.END, "")
-            listbox_index += 1
-            self.format_listbox.insert(tk.END, "=== AUDIO FORMATS ===")
-            listbox_index += 1
-            
-            for fmt in audio_formats[:5]:  # Limit to 5 best
-                abr = fmt.get('abr', 'Unknown')
-                ext = fmt.get('ext', 'Unknown')
-                filesize = fmt.get('filesize')
-                size_str = f" ({filesize//1024//1024}MB)" if filesize else ""
-                
-                text = f"{abr}kbps {ext.upper()}{size_str}"
-                self.format_listbox.insert(tk.END, text)
-                # Map this listbox index to the format_id
-                self.format_map[listbox_index] = fmt.get('format_id')
-                listbox_index += 1
+        # Group and sort formats (each codec field is read once per format)
+        has_video = [fmt.get('vcodec') not in (None, '', 'none') for fmt in formats]
+        video_formats = [fmt for fmt, v in zip(formats, has_video) if v]
+        audio_formats = [fmt for fmt, v in zip(formats, has_video)
+                         if not v and fmt.get('acodec') not in (None, '', 'none')]
+        
+        # Sort by quality. Missing/None values become 0 first so the sort can
+        # use C-level itemgetter keys (and never compares None with int)
+        for fmt in video_formats:
+            fmt['height'] = fmt.get('height') or 0
+        for fmt in audio_formats:
+            fmt['abr'] = fmt.get('abr') or 0
+        video_formats.sort(key=itemgetter('height'), reverse=True)
+        audio_formats.sort(key=itemgetter('abr'), reverse=True)
+        
+        # Build all rows up front (one column list per field) and insert them
+        # in a single Tcl call. format_map[row] is the row's format_id, or None
+        # for headers/spacers.
+        top_video = video_formats[:10]  # Limit to 10 best
+        top_audio = audio_formats[:5]  # Limit to 5 best
+        
+        heights = [fmt['height'] or 'Unknown' for fmt in top_video]
+        abrs = [fmt['abr'] or 'Unknown' for fmt in top_audio]
+        video_exts = [fmt.get('ext', 'Unknown') for fmt in top_video]
+        audio_exts = [fmt.get('ext', 'Unknown') for fmt in top_audio]
+        video_sizes = [f" ({size//1024//1024}MB)" if size else "" for size in (fmt.get('filesize') for fmt in top_video)]
+        audio_sizes = [f" ({size//1024//1024}MB)" if size else "" for size in (fmt.get('filesize') for fmt in top_audio)]
+        
+        lines = ["=== VIDEO FORMATS ==="]
+        format_ids = [None]
+        lines += [f"{height}p {ext.upper()}{size}" for height, ext, size in zip(heights, video_exts, video_sizes)]
+        format_ids += [fmt.get('format_id') or "" for fmt in top_video]
+        
+        if top_audio:
+            lines += ["", "=== AUDIO FORMATS ==="]
+            format_ids += [None, None]
+            lines += [f"{abr}kbps {ext.upper()}{size}" for abr, ext, size in zip(abrs, audio_exts, audio_sizes)]
+            format_ids += [fmt.get('format_id') or "" for fmt in top_audio]
+        
+        self.format_map = format_ids
+        self.format_listbox.insert(tk.END, *lines)
     
     def download_selected(self):
         selection = self.format_listbox.curselection()
@@ -258,7 +594,7 @@ class VideoPreviewWindow:
         selected_index = selection[0]
         
         # Check if the selected item is a header or empty line
-        if selected_index not in self.format_map:
+        if selected_index >= len(self.format_map) or self.format_map[selected_index] is None:
             messagebox.showwarning("Invalid Selection", "Please select a valid format (not a header or empty line).")
             return
         
@@ -282,9 +618,20 @@ class VideoPreviewWindow:
 class DownloadProgressFrame:
     """Frame showing download progress for a single item"""
     
+    _STATUS_COLORS = {
+        "pending": "orange",
+        "downloading": "lightblue", 
+        "completed": "lightgreen",
+        "failed": "lightcoral",
+        "cancelled": "gray"
+    }
+    _STATUS_TITLES = {status: status.title() for status in _STATUS_COLORS}
+    
     def __init__(self, parent_frame, download_item: DownloadItem, callback_remove):
         self.download_item = download_item
         self.callback_remove = callback_remove
+        # Last values pushed to each widget; unchanged values skip the Tcl call
+        self._cache = {'title': None, 'status': None, 'progress': None, 'details': None}
         
         # Main frame for this download
         self.frame = ctk.CTkFrame(parent_frame)
@@ -301,7 +648,7 @@ class DownloadProgressFrame:
         self.title_label = ctk.CTkLabel(
             top_frame, 
             text=self.download_item.title,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             anchor="w"
         )
         self.title_label.pack(side="left", fill="x", expand=True)
@@ -309,7 +656,7 @@ class DownloadProgressFrame:
         self.status_label = ctk.CTkLabel(
             top_frame,
             text=self.download_item.status.title(),
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="gray"
         )
         self.status_label.pack(side="right", padx=(10, 5))
@@ -337,7 +684,7 @@ class DownloadProgressFrame:
         self.details_label = ctk.CTkLabel(
             bottom_frame,
             text="Preparing...",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color="gray",
             anchor="w"
         )
@@ -346,47 +693,55 @@ class DownloadProgressFrame:
         self.url_label = ctk.CTkLabel(
             bottom_frame,
             text=self.download_item.url[:50] + "..." if len(self.download_item.url) > 50 else self.download_item.url,
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             text_color="darkgray",
             anchor="e"
         )
         self.url_label.pack(side="right")
     
     def update_display(self):
-        # Update status
-        status_colors = {
-            "pending": "orange",
-            "downloading": "lightblue", 
-            "completed": "lightgreen",
-            "failed": "lightcoral",
-            "cancelled": "gray"
-        }
+        item = self.download_item
+        cache = self._cache
         
-        self.status_label.configure(
-            text=self.download_item.status.title(),
-            text_color=status_colors.get(self.download_item.status, "gray")
-        )
+        # Update title (the worker replaces it once metadata is known)
+        if item.title != cache['title']:
+            self.title_label.configure(text=item.title)
+            cache['title'] = item.title
+        
+        # Update status
+        status = item.status
+        if status != cache['status']:
+            self.status_label.configure(
+                text=self._STATUS_TITLES.get(status) or status.title(),
+                text_color=self._STATUS_COLORS.get(status, "gray")
+            )
+            cache['status'] = status
         
         # Update progress bar
-        self.progress_bar.set(self.download_item.progress / 100.0)
+        progress = item.progress / 100.0
+        if progress != cache['progress']:
+            self.progress_bar.set(progress)
+            cache['progress'] = progress
         
         # Update details
-        if self.download_item.status == "downloading":
-            details = f"{self.download_item.progress:.1f}%"
-            if self.download_item.speed:
-                details += f" • {self.download_item.speed}"
-            if self.download_item.eta:
-                details += f" • ETA: {self.download_item.eta}"
-            if self.download_item.file_size:
-                details += f" • {self.download_item.file_size}"
-        elif self.download_item.status == "completed":
-            details = f"Completed • {self.download_item.filename}"
-        elif self.download_item.status == "failed":
-            details = f"Failed: {self.download_item.error}"
+        if status == "downloading":
+            details = f"{item.progress:.1f}%"
+            if item.speed:
+                details += f" • {item.speed}"
+            if item.eta:
+                details += f" • ETA: {item.eta}"
+            if item.file_size_bytes:
+                details += f" • {item.file_size_bytes//1024//1024}MB"
+        elif status == "completed":
+            details = f"Completed • {item.filename}"
+        elif status == "failed":
+            details = f"Failed: {item.error}"
         else:
             details = "Preparing..."
         
-        self.details_label.configure(text=details)
+        if details != cache['details']:
+            self.details_label.configure(text=details)
+            cache['details'] = details
     
     def remove(self):
         self.callback_remove(self.download_item.id)
@@ -399,8 +754,30 @@ class VideoDownloaderGUI:
         self.downloads: Dict[str, DownloadItem] = {}
         self.download_frames: Dict[str, DownloadProgressFrame] = {}
         self.settings = self.load_settings()
+        self._settings_dirty = threading.Event()
+        self._settings_write_lock = threading.Lock()
+        threading.Thread(target=self._settings_writer, name="settings-writer", daemon=True).start()
+        self.metadata_cache = MetadataCache(Path.home() / ".videodownloader_metacache.sqlite")
         self.current_preview_data = None
         self.preview_items = []
+        # Selection flags parallel to preview_items (1 = selected); counting and
+        # bulk select/deselect run over contiguous bytes in C
+        self.preview_selected = bytearray()
+        self._preview_time = 0.0  # time.monotonic() of the current preview
+        # Progress events from download threads, drained by _tick_ui
+        self._progress_queue: Queue = Queue()
+        # Downloads per status, kept current by _set_status so the status bar
+        # never has to scan self.downloads
+        self._status_counts: Counter = Counter()
+        self._status_lock = threading.Lock()
+        # Idle YoutubeDL instances keyed by their options. yt-dlp derives state
+        # (format selector, output templates) from params at construction, so
+        # an instance is only reused for jobs with identical options
+        self._ydl_pool: Dict[str, List[tuple]] = {}
+        self._ydl_pool_lock = threading.Lock()
+        # Downloads run on a bounded pool; extra jobs wait in its queue
+        self._download_pool = self._new_download_pool()
+        self._closing = threading.Event()  # Set on exit; running downloads abort
         
         # Create main window
         self.root = ctk.CTk()
@@ -413,41 +790,61 @@ class VideoDownloaderGUI:
         except:
             pass
         
+        # Background event loop for metadata I/O; results are handed back
+        # to Tk with root.after. Its blocking calls run on the metadata pool
+        self._meta_pool = ThreadPoolExecutor(max_workers=_META_WORKERS, thread_name_prefix="meta")
+        # url -> (time.monotonic(), Future of the full info), least recent first
+        self._info_cache: OrderedDict = OrderedDict()
+        self._info_pending = set()  # Unfinished fetches, evicted ones included
+        self._info_lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._meta_pool)
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        
         self.setup_ui()
         
-        # Start update thread
-        self.start_update_thread()
+        # UI refresh loop (Tk thread only; download threads never touch
+        # widgets). Started by start_download, stops itself when idle
+        self._tick_scheduled = False
+        self._settings_window: Optional["SettingsWindow"] = None  # Built on first open
     
     def load_settings(self) -> Dict:
         """Load settings from file"""
-        settings_file = Path.home() / ".videodownloader_settings.json"
-        default_settings = {
-            "output_dir": str(Path.home() / "Downloads" / "VideoDownloader"),
-            "quality": "best",
-            "format_preference": "mp4",
-            "audio_only": False,
-            "include_subtitles": False,
-            "concurrent_downloads": 3,
-            "organize_in_folders": False,
-            "save_metadata": False
-        }
+        settings_file = _settings_path()
+        default_settings = dict(_DEFAULT_SETTINGS)
         
         try:
             if settings_file.exists():
-                with open(settings_file, 'r') as f:
-                    saved_settings = json.load(f)
-                    default_settings.update(saved_settings)
+                saved_settings = json_loads(settings_file.read_bytes())
+                default_settings.update(saved_settings)
         except Exception as e:
             print(f"Failed to load settings: {e}")
         
         return default_settings
     
     def save_settings(self):
-        """Save settings to file"""
-        settings_file = Path.home() / ".videodownloader_settings.json"
+        """Save settings to file (asynchronously; bursts are written once)"""
+        self._settings_dirty.set()
+    
+    def _settings_writer(self):
+        """Writer thread: wait for a save request, let the burst settle, write"""
+        while True:
+            self._settings_dirty.wait()
+            time.sleep(_SETTINGS_WRITE_DELAY)
+            # Checked under the lock: run() may have flushed it meanwhile
+            with self._settings_write_lock:
+                if self._settings_dirty.is_set():
+                    self._settings_dirty.clear()
+                    self._write_settings()
+    
+    def _write_settings(self):
+        """Write the settings file; the caller holds _settings_write_lock"""
+        settings_file = _settings_path()
+        tmp_file = settings_file.with_name(settings_file.name + ".tmp")
         try:
-            with open(settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            tmp_file.write_bytes(json_dumps(dict(self.settings), indent=True))
+            # Atomic swap: a crash mid-write never leaves a truncated file
+            os.replace(tmp_file, settings_file)
         except Exception as e:
             print(f"Failed to save settings: {e}")
     
@@ -464,7 +861,7 @@ class VideoDownloaderGUI:
         title_label = ctk.CTkLabel(
             header_frame,
             text="🎯 VideoDownloader",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         )
         title_label.pack(side="left", padx=15, pady=12)
         
@@ -476,7 +873,7 @@ class VideoDownloaderGUI:
             fg_color="gray",
             height=30,
             width=100,
-            font=ctk.CTkFont(size=11)
+            font=_font(11)
         )
         settings_btn.pack(side="right", padx=15, pady=12)
         
@@ -487,7 +884,7 @@ class VideoDownloaderGUI:
         input_label = ctk.CTkLabel(
             input_frame,
             text="Video URL:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         input_label.pack(anchor="w", padx=15, pady=(12, 4))
         
@@ -497,7 +894,7 @@ class VideoDownloaderGUI:
         self.url_entry = ctk.CTkEntry(
             url_frame,
             placeholder_text="Paste video URL here (YouTube, TikTok, Instagram, etc.)",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             height=32
         )
         self.url_entry.pack(side="left", fill="x", expand=True, padx=(0, 8))
@@ -509,7 +906,7 @@ class VideoDownloaderGUI:
             text="Paste",
             width=60,
             height=32,
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             command=self.paste_url
         )
         paste_btn.pack(side="right")
@@ -521,7 +918,7 @@ class VideoDownloaderGUI:
         options_label = ctk.CTkLabel(
             options_frame,
             text="Download Options:",
-            font=ctk.CTkFont(size=11, weight="bold")
+            font=_font(11, "bold")
         )
         options_label.pack(side="left", padx=(0, 15))
         
@@ -530,7 +927,7 @@ class VideoDownloaderGUI:
             options_frame,
             text="🎥 Video",
             variable=self.video_checkbox_var,
-            font=ctk.CTkFont(size=11)
+            font=_font(11)
         )
         self.video_checkbox.pack(side="left", padx=(0, 15))
         
@@ -539,7 +936,7 @@ class VideoDownloaderGUI:
             options_frame,
             text="🎵 Audio",
             variable=self.audio_checkbox_var,
-            font=ctk.CTkFont(size=11)
+            font=_font(11)
         )
         self.audio_checkbox.pack(side="left", padx=(0, 15))
         
@@ -548,7 +945,7 @@ class VideoDownloaderGUI:
             options_frame,
             text="📄 Metadata",
             variable=self.metadata_checkbox_var,
-            font=ctk.CTkFont(size=11)
+            font=_font(11)
         )
         self.metadata_checkbox.pack(side="left")
         
@@ -572,7 +969,7 @@ class VideoDownloaderGUI:
         downloads_label = ctk.CTkLabel(
             downloads_header,
             text="Downloads Queue",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         downloads_label.pack(side="left", padx=10, pady=6)
         
@@ -583,7 +980,7 @@ class VideoDownloaderGUI:
             fg_color="red",
             width=100,
             height=26,
-            font=ctk.CTkFont(size=10)
+            font=_font(10)
         )
         clear_btn.pack(side="right", padx=10, pady=6)
         
@@ -595,7 +992,7 @@ class VideoDownloaderGUI:
         self.status_label = ctk.CTkLabel(
             main_frame,
             text="Ready",
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             text_color="gray"
         )
         self.status_label.pack(anchor="w", padx=15, pady=(0, 8))
@@ -609,21 +1006,58 @@ class VideoDownloaderGUI:
         self.preview_title_label = ctk.CTkLabel(
             preview_header,
             text="Content Preview",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         self.preview_title_label.pack(side="left", padx=10, pady=6)
         
         self.content_type_label = ctk.CTkLabel(
             preview_header,
             text="Enter URL to analyze content",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color="gray"
         )
         self.content_type_label.pack(side="right", padx=10, pady=6)
         
-        # Scrollable preview content
-        self.preview_scroll = ctk.CTkScrollableFrame(self.preview_frame)
-        self.preview_scroll.pack(fill="both", expand=True, padx=8, pady=(0, 6))
+        # Preview content: one Treeview draws every row itself instead of a
+        # set of CTk widgets per entry
+        tree_frame = ctk.CTkFrame(self.preview_frame, fg_color="transparent")
+        tree_frame.pack(fill="both", expand=True, padx=8, pady=(0, 6))
+        
+        # Styled on whatever theme is current; switching themes would restyle
+        # every ttk widget in the process
+        style = ttk.Style()
+        style.configure(
+            "Preview.Treeview",
+            background="#2b2b2b",
+            foreground="white",
+            fieldbackground="#2b2b2b",
+            borderwidth=0,
+            rowheight=26
+        )
+        style.configure("Preview.Treeview.Heading", background="#1f1f1f", foreground="gray", relief="flat")
+        style.map("Preview.Treeview.Heading", background=[("active", "#1f1f1f")])
+        
+        self.preview_tree = ttk.Treeview(
+            tree_frame,
+            columns=("sel", "title", "uploader"),
+            show="headings",
+            selectmode="none",
+            style="Preview.Treeview"
+        )
+        self.preview_tree.heading("sel", text="")
+        self.preview_tree.heading("title", text="Title", anchor="w")
+        self.preview_tree.heading("uploader", text="Uploader", anchor="w")
+        self.preview_tree.column("sel", width=32, minwidth=32, stretch=False, anchor="center")
+        self.preview_tree.column("title", width=260, anchor="w")
+        self.preview_tree.column("uploader", width=120, anchor="w")
+        
+        tree_scrollbar = ctk.CTkScrollbar(tree_frame, command=self.preview_tree.yview)
+        self.preview_tree.configure(yscrollcommand=tree_scrollbar.set)
+        tree_scrollbar.pack(side="right", fill="y")
+        self.preview_tree.pack(side="left", fill="both", expand=True)
+        
+        # Clicking the first column toggles the row's checkbox
+        self.preview_tree.bind("<Button-1>", self._on_preview_click)
         
         # Selection controls
         selection_frame = ctk.CTkFrame(self.preview_frame)
@@ -635,7 +1069,7 @@ class VideoDownloaderGUI:
             command=self.select_all_items,
             width=80,
             height=26,
-            font=ctk.CTkFont(size=10)
+            font=_font(10)
         )
         select_all_btn.pack(side="left", padx=8, pady=6)
         
@@ -646,7 +1080,7 @@ class VideoDownloaderGUI:
             fg_color="gray",
             width=80,
             height=26,
-            font=ctk.CTkFont(size=10)
+            font=_font(10)
         )
         select_none_btn.pack(side="left", padx=(4, 8), pady=6)
         
@@ -659,14 +1093,14 @@ class VideoDownloaderGUI:
             hover_color="darkgreen",
             width=120,
             height=26,
-            font=ctk.CTkFont(size=10, weight="bold")
+            font=_font(10, "bold")
         )
         self.add_to_queue_btn.pack(side="right", padx=8, pady=6)
         
         self.selection_count_label = ctk.CTkLabel(
             selection_frame,
             text="0 items selected",
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             text_color="gray"
         )
         self.selection_count_label.pack(side="right", padx=(10, 4), pady=6)
@@ -692,14 +1126,16 @@ class VideoDownloaderGUI:
             self.content_type_label.configure(text="Invalid URL")
             return
         
+        # Recently analyzed URLs are served from the metadata cache
+        cached_info = self.metadata_cache.get(url)
+        if cached_info is not None:
+            self._show_content_preview(cached_info)
+            return
+        
         self.content_type_label.configure(text="Analyzing...")
         
-        # Get content info in background thread
-        threading.Thread(
-            target=self._analyze_content_worker,
-            args=(url,),
-            daemon=True
-        ).start()
+        # Get content info on the background I/O loop
+        asyncio.run_coroutine_threadsafe(self._analyze_async(url), self._loop)
     
     def add_selected_to_queue(self):
         """Add selected preview items to download queue"""
@@ -707,7 +1143,7 @@ class VideoDownloaderGUI:
             messagebox.showwarning("No Content", "Please analyze content first.")
             return
         
-        selected_items = [item for item in self.preview_items if item.get('selected', False)]
+        selected_items = list(itertools.compress(self.preview_items, self.preview_selected))
         if not selected_items:
             messagebox.showwarning("No Selection", "Please select items to add to queue.")
             return
@@ -721,29 +1157,35 @@ class VideoDownloaderGUI:
             messagebox.showwarning("No Options", "Please select at least one download option (Video, Audio, or Metadata).")
             return
         
+        fresh = time.monotonic() - self._preview_time < _PREFETCH_MAX_AGE
+        
         # Add items to download queue
         for item in selected_items:
+            prefetched = {'prefetched_info': item.info} if fresh and item.info else {}
             if download_video:
                 video_options = {
                     'type': 'video',
                     'quality': self.settings.get('quality', 'best'),
-                    'format_preference': self.settings.get('format_preference', 'mp4')
+                    'format_preference': self.settings.get('format_preference', 'mp4'),
+                    **prefetched
                 }
-                self.start_download(item['url'], video_options)
+                self.start_download(item.url, video_options)
             
             if download_audio:
                 audio_options = {
                     'type': 'audio',
-                    'audio_only': True
+                    'audio_only': True,
+                    **prefetched
                 }
-                self.start_download(item['url'], audio_options)
+                self.start_download(item.url, audio_options)
             
             if download_metadata:
                 metadata_options = {
                     'type': 'metadata',
-                    'metadata_only': True
+                    'metadata_only': True,
+                    **prefetched
                 }
-                self.start_download(item['url'], metadata_options)
+                self.start_download(item.url, metadata_options)
         
         # Clear selections
         self.select_no_items()
@@ -751,8 +1193,8 @@ class VideoDownloaderGUI:
     def paste_url(self):
         """Paste URL from clipboard"""
         try:
-            clipboard_text = self.root.clipboard_get()
-            if clipboard_text and ("youtube.com" in clipboard_text or "youtu.be" in clipboard_text or "://" in clipboard_text):
+            clipboard_text = self.root.clipboard_get().strip()
+            if _CLIPBOARD_URL_RE.search(clipboard_text, 0, _CLIPBOARD_SCAN_LIMIT):
                 self.url_entry.delete(0, tk.END)
                 self.url_entry.insert(0, clipboard_text)
                 # Trigger analysis
@@ -764,53 +1206,77 @@ class VideoDownloaderGUI:
     
     def select_all_items(self):
         """Select all preview items"""
-        for item in self.preview_items:
-            item['selected'] = True
+        self.preview_selected[:] = b"\x01" * len(self.preview_items)
         self.update_preview_display()
         self.update_selection_count()
     
     def select_no_items(self):
         """Deselect all preview items"""
-        for item in self.preview_items:
-            item['selected'] = False
+        self.preview_selected[:] = bytes(len(self.preview_items))
         self.update_preview_display()
         self.update_selection_count()
     
     def update_selection_count(self):
         """Update the selection counter"""
-        selected = sum(1 for item in self.preview_items if item.get('selected', False))
+        selected = sum(self.preview_selected)
         total = len(self.preview_items)
         self.selection_count_label.configure(text=f"{selected} of {total} items selected")
     
 
     
-    def _analyze_content_worker(self, url):
-        """Worker thread to analyze content (video, playlist, channel)"""
+    def _extract_preview_info(self, url):
+        """Blocking yt-dlp extraction for the preview (runs in the loop's executor)"""
+        # Same base options as _extract_info: a single video's info may be
+        # reused by its downloads (see _setup_video_preview)
+        ydl_opts = {
+            **_EXTRACT_OPTS,
+            'extract_flat': True,  # For playlists/channels
+            'playlistend': _PREVIEW_PLAYLIST_END,  # Limit initial analysis
+        }
+        
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            return ydl.extract_info(url, download=False)
+    
+    async def _resolve_entries(self, entries):
+        """Fill in title/duration/uploader for flat entries, several at a time"""
+        sem = asyncio.Semaphore(_ENTRY_CONCURRENCY)
+        
+        async def fetch(entry):
+            async with sem:
+                return await asyncio.wrap_future(self._get_info(entry['url']))
+        
+        results = await asyncio.gather(*(fetch(e) for e in entries), return_exceptions=True)
+        for entry, result in zip(entries, results):
+            if isinstance(result, dict):
+                for key in ('title', 'duration', 'uploader'):
+                    if not entry.get(key) and result.get(key):
+                        entry[key] = result[key]
+    
+    async def _analyze_async(self, url):
+        """Analyze content (video, playlist, channel) on the background I/O loop"""
+        loop = asyncio.get_running_loop()
         try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': True,  # For playlists/channels
-                'playlistend': 50,  # Limit initial analysis
-            }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                # Analyze content type and show preview
-                self.root.after(0, self._show_content_preview, info)
-                
+            info = await loop.run_in_executor(None, self._extract_preview_info, url)
         except Exception as e:
-            self.root.after(0, lambda: self.content_type_label.configure(text=f"Error: {str(e)[:50]}"))
+            message = f"Error: {str(e)[:50]}"
+            self.root.after(0, lambda: self.content_type_label.configure(text=message))
+            return
+        
+        # Some extractors only give bare URLs in flat mode
+        untitled = [e for e in info.get('entries') or () if e and e.get('url') and not e.get('title')]
+        if untitled:
+            await self._resolve_entries(untitled)
+        
+        await loop.run_in_executor(None, self.metadata_cache.put, url, info)
+        
+        # Analyze content type and show preview
+        self.root.after(0, self._show_content_preview, info)
     
     def _show_content_preview(self, content_info):
         """Show content preview based on type"""
         self.current_preview_data = content_info
         self.preview_items.clear()
-        
-        # Clear existing preview content
-        for widget in self.preview_scroll.winfo_children():
-            widget.destroy()
+        self._preview_time = time.monotonic()
         
         # Determine content type
         is_playlist = content_info.get('_type') == 'playlist'
@@ -826,21 +1292,30 @@ class VideoDownloaderGUI:
             content_type = "Single Video"
             self._setup_video_preview(content_info)
         
+        # Everything starts out selected
+        self.preview_selected = bytearray(b"\x01" * len(self.preview_items))
+        
         # Update UI
+        tree = self.preview_tree
+        tree.delete(*tree.get_children())
+        checked = _CHECK_GLYPHS[1]
+        for i, item in enumerate(self.preview_items):
+            tree.insert("", "end", iid=str(i),
+                        values=(checked, item.display_title(), item.uploader or ""))
         self.content_type_label.configure(text=content_type)
         self.update_selection_count()
     
     def _setup_video_preview(self, video_info):
         """Setup preview for single video"""
-        self.preview_items.append({
-            'url': video_info.get('webpage_url', video_info.get('url')),
-            'title': video_info.get('title', 'Unknown Title'),
-            'duration': video_info.get('duration'),
-            'uploader': video_info.get('uploader'),
-            'selected': True,
-            'type': 'video'
-        })
-        self._create_preview_item_ui(self.preview_items[0], 0)
+        # Infos served from the metadata cache are stripped of stream URLs
+        formats = video_info.get('formats')
+        self.preview_items.append(PreviewItem(
+            url=video_info.get('webpage_url', video_info.get('url')),
+            title=video_info.get('title', 'Unknown Title'),
+            duration=video_info.get('duration'),
+            uploader=video_info.get('uploader'),
+            info=video_info if formats and 'url' in formats[0] else None
+        ))
     
     def _setup_playlist_preview(self, playlist_info):
         """Setup preview for playlist/channel"""
@@ -848,90 +1323,42 @@ class VideoDownloaderGUI:
         
         for i, entry in enumerate(entries):
             if entry:  # Sometimes entries can be None
-                self.preview_items.append({
-                    'url': entry.get('url', ''),
-                    'title': entry.get('title', f'Video {i+1}'),
-                    'duration': entry.get('duration'),
-                    'uploader': entry.get('uploader', playlist_info.get('uploader')),
-                    'selected': True,
-                    'type': 'video'
-                })
-                self._create_preview_item_ui(self.preview_items[-1], len(self.preview_items)-1)
-    
-    def _create_preview_item_ui(self, item, index):
-        """Create UI element for preview item"""
-        item_frame = ctk.CTkFrame(self.preview_scroll)
-        item_frame.pack(fill="x", padx=4, pady=2)
-        
-        # Checkbox and info
-        left_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
-        left_frame.pack(side="left", fill="both", expand=True, padx=8, pady=6)
-        
-        # Checkbox
-        checkbox_var = ctk.BooleanVar(value=item['selected'])
-        checkbox = ctk.CTkCheckBox(
-            left_frame,
-            text="",
-            variable=checkbox_var,
-            command=lambda idx=index: self._toggle_item_selection(idx, checkbox_var.get())
-        )
-        checkbox.pack(side="left", padx=(0, 8))
-        
-        # Title and details
-        info_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
-        info_frame.pack(side="left", fill="both", expand=True)
-        
-        # Title with duration inline
-        title_text = item['title']
-        if item['duration']:
-            try:
-                duration = int(float(item['duration']))  # Handle both int and float
-                duration_str = f"{duration//60}:{duration%60:02d}"
-                title_text += f" ({duration_str})"
-            except (ValueError, TypeError):
-                # Skip duration if it can't be parsed
-                pass
-        
-        title_label = ctk.CTkLabel(
-            info_frame,
-            text=title_text,
-            font=ctk.CTkFont(size=11, weight="bold"),
-            anchor="w"
-        )
-        title_label.pack(anchor="w")
-        
-        # Only show uploader if available
-        if item['uploader']:
-            uploader_label = ctk.CTkLabel(
-                info_frame,
-                text=f"By: {item['uploader']}",
-                font=ctk.CTkFont(size=9),
-                text_color="gray",
-                anchor="w"
-            )
-            uploader_label.pack(anchor="w")
-        
-        # Store UI reference
-        item['ui_frame'] = item_frame
-        item['checkbox_var'] = checkbox_var
+                self.preview_items.append(PreviewItem(
+                    url=entry.get('url', ''),
+                    title=entry.get('title', f'Video {i+1}'),
+                    duration=entry.get('duration'),
+                    uploader=entry.get('uploader', playlist_info.get('uploader'))
+                ))
+    
+    def _on_preview_click(self, event):
+        """Toggle an item when its checkbox cell is clicked"""
+        tree = self.preview_tree
+        if tree.identify_region(event.x, event.y) != "cell" or tree.identify_column(event.x) != "#1":
+            return
+        iid = tree.identify_row(event.y)
+        if iid:
+            index = int(iid)
+            self._toggle_item_selection(index, not self.preview_selected[index])
     
     def _toggle_item_selection(self, index, selected):
         """Toggle selection state of preview item"""
         if index < len(self.preview_items):
-            self.preview_items[index]['selected'] = selected
+            self.preview_selected[index] = 1 if selected else 0
+            self.preview_tree.set(str(index), "sel", _CHECK_GLYPHS[self.preview_selected[index]])
             self.update_selection_count()
     
     def update_preview_display(self):
         """Update the preview display with current selection states"""
-        for item in self.preview_items:
-            if 'checkbox_var' in item:
-                item['checkbox_var'].set(item['selected'])
+        for i, selected in enumerate(self.preview_selected):
+            self.preview_tree.set(str(i), "sel", _CHECK_GLYPHS[selected])
     
     def start_download(self, url: str, options: Dict):
         """Start a new download"""
         # Create download item
         download_item = DownloadItem(url)
-        self.downloads[download_item.id] = download_item
+        with self._status_lock:
+            self.downloads[download_item.id] = download_item
+            self._status_counts[download_item.status] += 1
         
         # Create UI frame
         frame = DownloadProgressFrame(
@@ -941,12 +1368,9 @@ class VideoDownloaderGUI:
         )
         self.download_frames[download_item.id] = frame
         
-        # Start download thread
-        threading.Thread(
-            target=self._download_worker,
-            args=(download_item, options),
-            daemon=True
-        ).start()
+        # Queue the download on the worker pool
+        download_item.future = self._download_pool.submit(self._download_worker, download_item, options)
+        self._schedule_tick()
         
         self.update_status()
     
@@ -954,39 +1378,13 @@ class VideoDownloaderGUI:
         """Worker thread for downloading"""
         try:
             # Update status
-            download_item.status = "downloading"
+            self._set_status(download_item, "downloading")
+            download_item.dirty = True
             
             # Setup output directory
             output_dir = Path(self.settings["output_dir"])
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Progress hook
-            def progress_hook(d):
-                if d['status'] == 'downloading':
-                    # Update progress
-                    percent_str = d.get('_percent_str', '0%').replace('%', '')
-                    try:
-                        download_item.progress = float(percent_str)
-                    except:
-                        pass
-                    
-                    download_item.speed = d.get('_speed_str', '')
-                    download_item.eta = d.get('_eta_str', '')
-                    
-                    if d.get('total_bytes'):
-                        download_item.file_size = f"{d['total_bytes']//1024//1024}MB"
-                    
-                    if d.get('filename'):
-                        download_item.filename = Path(d['filename']).name
-                
-                elif d['status'] == 'finished':
-                    download_item.status = "completed"
-                    download_item.progress = 100.0
-                    download_item.end_time = datetime.now()
-                    if d.get('filename'):
-                        download_item.filename = Path(d['filename']).name
-                        download_item.filepath = d['filename']
-            
             # Setup yt-dlp options with dynamic output template
             # Configure output template based on organize_in_folders setting
             if self.settings["organize_in_folders"]:
@@ -998,7 +1396,6 @@ class VideoDownloaderGUI:
             
             ydl_opts = {
                 'outtmpl': outtmpl,
-                'progress_hooks': [progress_hook],
                 'quiet': True,
                 'no_warnings': True,
             }
@@ -1033,49 +1430,12 @@ class VideoDownloaderGUI:
                 elif download_type == 'video':
                     download_item.title = f"[Video] {download_item.title}"
                 
-                if download_type == 'audio' or force_audio_only:
-                    # Audio-only downloads
-                    if format_pref == "mp4":
-                        ydl_opts['format'] = 'ba[ext=m4a]/ba'
-                    elif format_pref == "webm":
-                        ydl_opts['format'] = 'ba[ext=webm]/ba'
-                    else:
-                        ydl_opts['format'] = 'ba/b'
-                else:
-                    # Video downloads with audio
-                    if quality == "best":
-                        if format_pref == "mp4":
-                            # Best quality MP4 with fallback
-                            ydl_opts['format'] = 'bv*[ext=mp4][height<=1080]+ba[ext=m4a]/bv*[height<=1080]+ba/b[height<=1080]'
-                            ydl_opts['merge_output_format'] = 'mp4'
-                        elif format_pref == "webm":
-                            # Best quality WebM
-                            ydl_opts['format'] = 'bv*[ext=webm]+ba[ext=webm]/bv*+ba'
-                            ydl_opts['merge_output_format'] = 'webm'
-                        elif format_pref == "mkv":
-                            # High quality MKV (for those who need it)
-                            ydl_opts['format'] = 'bv*+ba/b'
-                            ydl_opts['merge_output_format'] = 'mkv'
-                        else:  # "any"
-                            # Best available format, prefer MP4
-                            ydl_opts['format'] = 'bv*[ext=mp4]+ba[ext=m4a]/bv*+ba/b'
-                            ydl_opts['merge_output_format'] = 'mp4'
-                    elif quality == "worst":
-                        ydl_opts['format'] = 'wv*+wa/w'
-                    else:
-                        # Specific quality with format preference
-                        quality_num = quality.replace('p', '')
-                        if format_pref == "mp4":
-                            ydl_opts['format'] = f'bv*[height<={quality_num}][ext=mp4]+ba[ext=m4a]/bv*[height<={quality_num}]+ba'
-                            ydl_opts['merge_output_format'] = 'mp4'
-                        elif format_pref == "webm":
-                            ydl_opts['format'] = f'bv*[height<={quality_num}][ext=webm]+ba[ext=webm]/bv*[height<={quality_num}]+ba'
-                            ydl_opts['merge_output_format'] = 'webm'
-                        elif format_pref == "mkv":
-                            ydl_opts['format'] = f'bv*[height<={quality_num}]+ba'
-                            ydl_opts['merge_output_format'] = 'mkv'
-                        else:  # "any"
-                            ydl_opts['format'] = f'bv*[height<={quality_num}]+ba'
+                kind = "audio" if download_type == 'audio' or force_audio_only else "video"
+                key = (kind, format_pref, quality)
+                fmt, merge_format = FORMAT_MATRIX.get(key) or build_format(*key)
+                ydl_opts['format'] = fmt
+                if merge_format:
+                    ydl_opts['merge_output_format'] = merge_format
                 
                 # Add subtitles if enabled
                 if self.settings.get("include_subtitles", False):
@@ -1083,90 +1443,277 @@ class VideoDownloaderGUI:
                     ydl_opts['subtitleslangs'] = ['en']
             
             # Download
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # First get info to update title
-                info = ydl.extract_info(download_item.url, download=False)
+            key, ydl, job = self._acquire_ydl(ydl_opts)
+            job[0] = download_item.id
+            try:
+                # First get info to update title; the preview may already have it.
+                # Processing mutates the dict and it can be shared by several
+                # jobs, so each gets its own copy. Shared info has no subtitle
+                # tracks, so jobs that save subtitles extract their own
+                if ydl_opts.get('writesubtitles'):
+                    info = ydl.extract_info(download_item.url, download=False, process=False)
+                else:
+                    info = options.get('prefetched_info')
+                    if info is None:
+                        info = self._get_info(download_item.url).result()
+                    info = copy.deepcopy(info)
                 download_item.title = info.get('title', download_item.title)
+                download_item.dirty = True
                 
-                # Now download
-                ydl.download([download_item.url])
+                # Now download from the extracted info instead of letting
+                # download() extract the URL a second time
+                ydl.process_ie_result(info, download=True)
+            except BaseException:
+                # A failed instance may be left mid-download; close it
+                # rather than handing it to the next job
+                job[0] = None
+                ydl.close()
+                raise
+            
+            # Only instances that finished cleanly go back to the pool
+            self._release_ydl(key, ydl, job)
             
+            # Fill in the final state before the status change: once the
+            # counters say nothing is running the next tick is the last one
             if download_item.status != "completed":
-                download_item.status = "completed"
                 download_item.progress = 100.0
-                download_item.end_time = datetime.now()
+                download_item.end_time = time.monotonic()
+                self._set_status(download_item, "completed")
                 
         except Exception as e:
-            download_item.status = "failed"
             download_item.error = str(e)
-            download_item.end_time = datetime.now()
+            download_item.end_time = time.monotonic()
+            self._set_status(download_item, "failed")
             print(f"Download failed: {e}")
     
+    def _get_info(self, url: str) -> Future:
+        """Full info for a URL, fetched at most once on the metadata pool.
+        
+        Results stay cached (LRU) for as long as their stream URLs are likely
+        valid; concurrent callers for the same URL share one in-flight fetch.
+        """
+        now = time.monotonic()
+        with self._info_lock:
+            cached = self._info_cache.get(url)
+            if cached is not None and now - cached[0] < _PREFETCH_MAX_AGE:
+                self._info_cache.move_to_end(url)
+                return cached[1]
+            future = self._meta_pool.submit(_extract_info, url)
+            self._info_pending.add(future)
+            self._info_cache[url] = (now, future)
+            self._info_cache.move_to_end(url)
+            if len(self._info_cache) > _INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+        future.add_done_callback(functools.partial(self._info_done, url))
+        return future
+    
+    def _info_done(self, url: str, future: Future):
+        """Forget a finished fetch; errors aren't cached, the next request retries"""
+        failed = not future.cancelled() and future.exception() is not None
+        with self._info_lock:
+            self._info_pending.discard(future)
+            if failed:
+                cached = self._info_cache.get(url)
+                if cached is not None and cached[1] is future:
+                    del self._info_cache[url]
+    
+    def _acquire_ydl(self, ydl_opts: Dict):
+        """Take an idle YoutubeDL built with these options, or build one.
+        
+        Returns (key, ydl, job); set job[0] to the download id whose progress
+        the instance should report.
+        """
+        key = repr(sorted(ydl_opts.items()))
+        with self._ydl_pool_lock:
+            idle = self._ydl_pool.get(key)
+            if idle:
+                return (key,) + idle.pop()
+        
+        job = [None]
+        hook = functools.partial(_progress_hook, self._progress_queue, self._closing, job)
+        ydl = yt_dlp.YoutubeDL(dict(ydl_opts, progress_hooks=[hook]))
+        return key, ydl, job
+    
+    def _release_ydl(self, key: str, ydl, job: list):
+        """Return a YoutubeDL to the pool (bounded by the concurrent download limit)"""
+        job[0] = None
+        with self._ydl_pool_lock:
+            idle = self._ydl_pool.setdefault(key, [])
+            # Once the app is closing the pool has been emptied for good
+            if not self._closing.is_set() and len(idle) < self.settings.get("concurrent_downloads", 3):
+                idle.append((ydl, job))
+                return
+        ydl.close()
+    
+    def _set_status(self, download_item: DownloadItem, status: str):
+        """Change a download's status and move it between the status counters"""
+        with self._status_lock:
+            # Mark dirty before the counters change, so a tick that sees no
+            # active downloads still redraws this one
+            download_item.dirty = True
+            # Removed downloads are no longer counted
+            if download_item.id in self.downloads:
+                self._status_counts[download_item.status] -= 1
+                self._status_counts[status] += 1
+            download_item.status = status
+    
+    def _schedule_tick(self):
+        if not self._tick_scheduled:
+            self._tick_scheduled = True
+            self.root.after(100, self._tick_ui)
+    
+    def _tick_ui(self):
+        """Single periodic UI update: apply queued progress, then redraw what changed"""
+        self._tick_scheduled = False
+        # Read before draining: a download that finishes after this point
+        # still gets one more tick to draw its final state
+        counts = self._status_counts
+        active = counts["pending"] or counts["downloading"]
+        
+        latest = {}
+        while True:
+            try:
+                download_id, d = self._progress_queue.get_nowait()
+            except Empty:
+                break
+            latest[download_id] = d
+        
+        for download_id, d in latest.items():
+            download_item = self.downloads.get(download_id)
+            if download_item is not None:  # May have been removed meanwhile
+                download_item.apply_progress(d)
+                if d['status'] == 'finished':
+                    self._set_status(download_item, "completed")
+        
+        self._refresh_dirty()
+        
+        # Keep ticking only while downloads are running; idle costs nothing
+        if active or not self._progress_queue.empty():
+            self._schedule_tick()
+    
+    def _refresh_dirty(self):
+        """Redraw the frames of downloads whose state changed since the last redraw"""
+        changed = False
+        for download_id, download_item in self.downloads.items():
+            if download_item.dirty:
+                download_item.dirty = False
+                frame = self.download_frames.get(download_id)
+                if frame is not None:
+                    frame.update_display()
+                changed = True
+        if changed:
+            self.update_status()
+    
+    def _new_download_pool(self) -> ThreadPoolExecutor:
+        workers = max(1, int(self.settings.get("concurrent_downloads", 3)))
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="download")
+    
+    def set_concurrent_downloads(self, count: int):
+        """Resize the download pool; jobs already queued finish on the old one"""
+        if count == self.settings.get("concurrent_downloads"):
+            return
+        self.settings["concurrent_downloads"] = count
+        old_pool, self._download_pool = self._download_pool, self._new_download_pool()
+        old_pool.shutdown(wait=False)
+    
     def remove_download(self, download_id: str):
         """Remove a download from the list"""
-        if download_id in self.downloads:
-            del self.downloads[download_id]
+        self._forget_download(download_id)
+        self.update_status()
+    
+    def _forget_download(self, download_id: str):
+        """Drop a download's state and frame reference (the caller redraws the status bar)"""
+        with self._status_lock:
+            download_item = self.downloads.pop(download_id, None)
+            if download_item is not None:
+                self._status_counts[download_item.status] -= 1
+        # Drop it from the queue if it hasn't started yet
+        if download_item is not None and download_item.future is not None:
+            download_item.future.cancel()
         if download_id in self.download_frames:
             del self.download_frames[download_id]
-        self.update_status()
     
     def clear_completed(self):
         """Clear all completed downloads"""
+        counts = self._status_counts
+        if not (counts["completed"] or counts["failed"] or counts["cancelled"]):
+            return
+        
         to_remove = []
         for download_id, download_item in self.downloads.items():
             if download_item.status in ["completed", "failed", "cancelled"]:
                 to_remove.append(download_id)
         
+        # Unmap the list while its rows go so the scroll frame reflows once,
+        # not once per destroyed row
+        self.downloads_scroll.pack_forget()
         for download_id in to_remove:
             if download_id in self.download_frames:
                 self.download_frames[download_id].frame.destroy()
-            self.remove_download(download_id)
+            self._forget_download(download_id)
+        self.downloads_scroll.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        self.update_status()
     
     def open_settings(self):
         """Open settings window"""
-        SettingsWindow(self)
+        if self._settings_window is None:
+            self._settings_window = SettingsWindow(self)
+        else:
+            self._settings_window.show()
     
     def update_status(self):
         """Update status bar"""
-        active_downloads = sum(1 for d in self.downloads.values() if d.status == "downloading")
-        completed_downloads = sum(1 for d in self.downloads.values() if d.status == "completed")
-        failed_downloads = sum(1 for d in self.downloads.values() if d.status == "failed")
-        
-        status_text = f"Active: {active_downloads} | Completed: {completed_downloads} | Failed: {failed_downloads}"
+        counts = self._status_counts
+        status_text = f"Active: {counts['downloading']} | Completed: {counts['completed']} | Failed: {counts['failed']}"
         self.status_label.configure(text=status_text)
     
-    def start_update_thread(self):
-        """Start background thread to update UI"""
-        def update_loop():
-            while True:
-                try:
-                    # Update all download frames
-                    for frame in self.download_frames.values():
-                        self.root.after(0, frame.update_display)
-                    
-                    # Update status
-                    self.root.after(0, self.update_status)
-                    
-                    time.sleep(0.5)  # Update every 500ms
-                except:
-                    break
-        
-        threading.Thread(target=update_loop, daemon=True).start()
-    
     def is_valid_url(self, url: str) -> bool:
         """Check if URL is valid"""
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        return url_pattern.match(url) is not None
+        try:
+            parts = urlsplit(url)
+            parts.port  # Raises ValueError for a malformed port
+        except ValueError:
+            return False
+        return (parts.scheme in _URL_SCHEMES
+                and _HOST_RE.fullmatch(parts.hostname or "") is not None
+                and _SPACE_RE.search(url) is None)
     
     def run(self):
         """Start the application"""
         self.root.mainloop()
+        
+        # Pool threads aren't daemons: drop queued jobs and make the running
+        # ones abort at their next progress update so the process can exit
+        self._closing.set()
+        for download_item in list(self.downloads.values()):
+            if download_item.future is not None:
+                download_item.future.cancel()
+        self._download_pool.shutdown(wait=False)
+        
+        # Same for the metadata pool: drop extractions that haven't started
+        # (no cancel_futures= on Python 3.8)
+        with self._info_lock:
+            pending = list(self._info_pending)
+            self._info_cache.clear()
+        for future in pending:
+            future.cancel()
+        self._meta_pool.shutdown(wait=False)
+        
+        # Close the idle pooled YoutubeDLs; busy ones are closed by their
+        # workers on release
+        with self._ydl_pool_lock:
+            idle = [ydl for pooled in self._ydl_pool.values() for ydl, _ in pooled]
+            self._ydl_pool.clear()
+        for ydl in idle:
+            ydl.close()
+        
+        # The writer is a daemon thread: wait out a write in progress, flush a
+        # pending save ourselves, and keep the lock so no write starts that
+        # interpreter exit could cut short
+        self._settings_write_lock.acquire()
+        if self._settings_dirty.is_set():
+            self._settings_dirty.clear()
+            self._write_settings()
 
 class SettingsWindow:
     """Settings configuration window"""
@@ -1180,6 +1727,8 @@ class SettingsWindow:
         self.window.geometry("600x600")
         self.window.transient(parent.root)
         self.window.grab_set()
+        # Closing the window hides it so the next open can reuse it
+        self.window.protocol("WM_DELETE_WINDOW", self.cancel)
         
         self.setup_ui()
     
@@ -1192,7 +1741,7 @@ class SettingsWindow:
         title_label = ctk.CTkLabel(
             main_frame, 
             text="Settings", 
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         title_label.pack(pady=(0, 30))
         
@@ -1207,7 +1756,7 @@ class SettingsWindow:
         dir_label = ctk.CTkLabel(
             dir_frame, 
             text="Download Directory:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         dir_label.pack(anchor="w", padx=15, pady=(15, 5))
         
@@ -1239,7 +1788,7 @@ class SettingsWindow:
         quality_label = ctk.CTkLabel(
             quality_format_frame,
             text="Video Quality:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         quality_label.pack(anchor="w", padx=15, pady=(15, 5))
         
@@ -1247,7 +1796,7 @@ class SettingsWindow:
         quality_menu = ctk.CTkOptionMenu(
             quality_format_frame,
             variable=self.quality_var,
-            values=["best", "worst", "720p", "480p", "360p"],
+            values=list(QUALITY_CHOICES),
             height=35,
             width=200
         )
@@ -1257,7 +1806,7 @@ class SettingsWindow:
         format_label = ctk.CTkLabel(
             quality_format_frame,
             text="Preferred Format:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         format_label.pack(anchor="w", padx=15, pady=(15, 5))
         
@@ -1265,7 +1814,7 @@ class SettingsWindow:
         format_menu = ctk.CTkOptionMenu(
             quality_format_frame,
             variable=self.format_var,
-            values=["mp4", "webm", "mkv", "any"]
+            values=list(FORMAT_CHOICES)
         )
         format_menu.pack(anchor="w", padx=15, pady=(0, 5))
         
@@ -1273,7 +1822,7 @@ class SettingsWindow:
         format_desc = ctk.CTkLabel(
             quality_format_frame,
             text="MP4: Universal compatibility • WebM: Good compression • MKV: High quality • Any: Best available",
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             text_color="gray",
             wraplength=450
         )
@@ -1286,7 +1835,7 @@ class SettingsWindow:
         options_label = ctk.CTkLabel(
             options_frame,
             text="Download Options:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         options_label.pack(anchor="w", padx=15, pady=(15, 10))
         
@@ -1295,7 +1844,7 @@ class SettingsWindow:
             options_frame,
             text="Audio only (extract audio from videos)",
             variable=self.audio_only_var,
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         audio_only_check.pack(anchor="w", padx=15, pady=5)
         
@@ -1304,7 +1853,7 @@ class SettingsWindow:
             options_frame,
             text="Include subtitles when available",
             variable=self.subtitles_var,
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         subtitles_check.pack(anchor="w", padx=15, pady=5)
         
@@ -1313,7 +1862,7 @@ class SettingsWindow:
             options_frame,
             text="Organize playlist/channel downloads into sub-folders",
             variable=self.organize_folders_var,
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         organize_folders_check.pack(anchor="w", padx=15, pady=5)
         
@@ -1322,9 +1871,38 @@ class SettingsWindow:
             options_frame,
             text="Save video metadata (.info.json file)",
             variable=self.save_metadata_var,
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
+        )
+        save_metadata_check.pack(anchor="w", padx=15, pady=5)
+        
+        concurrent_frame = ctk.CTkFrame(options_frame, fg_color="transparent")
+        concurrent_frame.pack(anchor="w", padx=15, pady=5)
+        
+        concurrent_label = ctk.CTkLabel(
+            concurrent_frame,
+            text="Max concurrent downloads:",
+            font=_font(12)
+        )
+        concurrent_label.pack(side="left", padx=(0, 10))
+        
+        self.concurrent_var = ctk.StringVar(value=str(self.parent.settings.get("concurrent_downloads", 3)))
+        concurrent_menu = ctk.CTkOptionMenu(
+            concurrent_frame,
+            variable=self.concurrent_var,
+            values=[str(n) for n in range(1, 9)],
+            width=70
+        )
+        concurrent_menu.pack(side="left")
+        
+        clear_cache_btn = ctk.CTkButton(
+            options_frame,
+            text="Clear metadata cache",
+            command=self.clear_metadata_cache,
+            fg_color="gray",
+            height=30,
+            width=180
         )
-        save_metadata_check.pack(anchor="w", padx=15, pady=(5, 15))
+        clear_cache_btn.pack(anchor="w", padx=15, pady=(5, 15))
         
         # Buttons
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -1349,6 +1927,30 @@ class SettingsWindow:
         )
         save_btn.pack(side="right")
     
+    def show(self):
+        """Re-open the hidden window with the current settings"""
+        self.reload()
+        self.window.deiconify()
+        self.window.grab_set()
+        self.window.focus()
+    
+    def hide(self):
+        self.window.grab_release()
+        self.window.withdraw()
+    
+    def reload(self):
+        """Reset every control to the saved settings (discards unsaved edits)"""
+        settings = self.parent.settings
+        self.dir_entry.delete(0, tk.END)
+        self.dir_entry.insert(0, settings["output_dir"])
+        self.quality_var.set(settings["quality"])
+        self.format_var.set(settings.get("format_preference", "mp4"))
+        self.audio_only_var.set(settings["audio_only"])
+        self.subtitles_var.set(settings["include_subtitles"])
+        self.organize_folders_var.set(settings["organize_in_folders"])
+        self.save_metadata_var.set(settings["save_metadata"])
+        self.concurrent_var.set(str(settings.get("concurrent_downloads", 3)))
+    
     def browse_directory(self):
         """Browse for download directory"""
         directory = filedialog.askdirectory(
@@ -1358,6 +1960,11 @@ class SettingsWindow:
             self.dir_entry.delete(0, tk.END)
             self.dir_entry.insert(0, directory)
     
+    def clear_metadata_cache(self):
+        """Forget all previously analyzed URLs"""
+        self.parent.metadata_cache.clear()
+        messagebox.showinfo("Metadata Cache", "Metadata cache cleared.", parent=self.window)
+    
     def save(self):
         """Save settings"""
         self.parent.settings["output_dir"] = self.dir_entry.get()
@@ -1367,13 +1974,14 @@ class SettingsWindow:
         self.parent.settings["include_subtitles"] = self.subtitles_var.get()
         self.parent.settings["organize_in_folders"] = self.organize_folders_var.get()
         self.parent.settings["save_metadata"] = self.save_metadata_var.get()
+        self.parent.set_concurrent_downloads(int(self.concurrent_var.get()))
         
         self.parent.save_settings()
-        self.window.destroy()
+        self.hide()
     
     def cancel(self):
         """Cancel settings"""
-        self.window.destroy()
+        self.hide()
 
 if __name__ == "__main__":
     # Create and run application